@@ -9,6 +9,20 @@ import threading
 import time
 from functools import wraps
 import gzip
+import hmac
+import io
+import sys
+import random
+import heapq
+import bisect
+import base64
+import hashlib
+import mmap
+import shutil
+import fcntl
+from contextlib import contextmanager
+import cProfile
+import pstats
 from werkzeug.exceptions import RequestEntityTooLarge
 
 app = Flask(__name__)
@@ -34,9 +48,15 @@ USERS_FILE = os.path.join(DATA_DIR, 'users.json')
 GUESSES_FILE = os.path.join(DATA_DIR, 'guesses.json')
 RESULTS_FILE = os.path.join(DATA_DIR, 'actual_results.json')
 BACKUP_DIR = os.path.join(DATA_DIR, 'backups')
+SNAPSHOT_DIR = os.path.join(DATA_DIR, 'snapshots')
+SNAPSHOT_POINTER_FILE = os.path.join(SNAPSHOT_DIR, 'CURRENT')
+FREEZE_LOCK_FILE = os.path.join(SNAPSHOT_DIR, 'freeze.lock')
 
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
 
+ADMIN_TOKEN = os.environ.get('BITBETS_ADMIN_TOKEN', '')
+MAX_CONCURRENT_REQUESTS = int(os.environ.get('BITBETS_MAX_CONCURRENT', 8))
+
 data_cache = {
     'users': {},
     'guesses': {},
@@ -120,11 +140,351 @@ def handle_errors(f):
             }), 500
     return decorated_function
 
+def require_admin(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        auth_header = request.headers.get('Authorization', '')
+        token = auth_header[len('Bearer '):] if auth_header.startswith('Bearer ') else ''
+        
+        if not ADMIN_TOKEN or not hmac.compare_digest(token.encode('utf-8'), ADMIN_TOKEN.encode('utf-8')):
+            logger.warning(f"Unauthorized admin request to {request.path}")
+            return jsonify({
+                'status': 'error',
+                'message': 'Admin authorization required'
+            }), 403
+        
+        return f(*args, **kwargs)
+    return decorated_function
+
+PRIORITY_CRITICAL = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_CRITICAL: 'critical',
+    PRIORITY_NORMAL: 'normal',
+    PRIORITY_LOW: 'low'
+}
+
+ADMISSION_QUEUE_LIMITS = {
+    PRIORITY_CRITICAL: 200,
+    PRIORITY_NORMAL: 50,
+    PRIORITY_LOW: 10
+}
+
+ADMISSION_QUEUE_TIMEOUTS = {
+    PRIORITY_CRITICAL: 10.0,
+    PRIORITY_NORMAL: 3.0,
+    PRIORITY_LOW: 0.5
+}
+
+ADMISSION_RETRY_AFTER = {
+    PRIORITY_CRITICAL: 1,
+    PRIORITY_NORMAL: 2,
+    PRIORITY_LOW: 10
+}
+
+admission_state = {
+    'in_flight': 0,
+    'waiters': [],
+    'sequence': 0,
+    'queued': {priority: 0 for priority in PRIORITY_NAMES},
+    'admitted': {priority: 0 for priority in PRIORITY_NAMES},
+    'shed': {priority: 0 for priority in PRIORITY_NAMES},
+    'timed_out': {priority: 0 for priority in PRIORITY_NAMES}
+}
+
+admission_lock = threading.Lock()
+
+def acquire_admission(priority):
+    with admission_lock:
+        state = admission_state
+        if state['in_flight'] < MAX_CONCURRENT_REQUESTS and not state['waiters']:
+            state['in_flight'] += 1
+            state['admitted'][priority] += 1
+            return True
+        
+        # Shed low-priority work up front while anything more important is
+        # already waiting, rather than letting it hold a queue position. Reads
+        # queue behind writes instead; the heap serves writes first anyway.
+        higher_waiting = priority == PRIORITY_LOW and any(state['queued'][p] for p in PRIORITY_NAMES if p < priority)
+        if higher_waiting or state['queued'][priority] >= ADMISSION_QUEUE_LIMITS[priority]:
+            state['shed'][priority] += 1
+            return False
+        
+        waiter = {'event': threading.Event(), 'granted': False, 'cancelled': False, 'priority': priority}
+        state['sequence'] += 1
+        heapq.heappush(state['waiters'], (priority, state['sequence'], waiter))
+        state['queued'][priority] += 1
+    
+    waiter['event'].wait(ADMISSION_QUEUE_TIMEOUTS[priority])
+    
+    with admission_lock:
+        if waiter['granted']:
+            admission_state['admitted'][priority] += 1
+            return True
+        
+        waiter['cancelled'] = True
+        admission_state['queued'][priority] -= 1
+        admission_state['timed_out'][priority] += 1
+        return False
+
+def release_admission():
+    with admission_lock:
+        state = admission_state
+        while state['waiters']:
+            _, _, waiter = heapq.heappop(state['waiters'])
+            if waiter['cancelled']:
+                continue
+            
+            # Hand the slot straight to the next waiter; in_flight is unchanged.
+            waiter['granted'] = True
+            state['queued'][waiter['priority']] -= 1
+            waiter['event'].set()
+            return
+        
+        state['in_flight'] -= 1
+
+def admission_status():
+    with admission_lock:
+        state = admission_state
+        return {
+            'max_concurrent': MAX_CONCURRENT_REQUESTS,
+            'in_flight': state['in_flight'],
+            'queue_depth': {PRIORITY_NAMES[p]: state['queued'][p] for p in PRIORITY_NAMES},
+            'admitted': {PRIORITY_NAMES[p]: state['admitted'][p] for p in PRIORITY_NAMES},
+            'shed': {PRIORITY_NAMES[p]: state['shed'][p] for p in PRIORITY_NAMES},
+            'timed_out': {PRIORITY_NAMES[p]: state['timed_out'][p] for p in PRIORITY_NAMES}
+        }
+
+def admission_control(get=PRIORITY_NORMAL, post=PRIORITY_NORMAL):
+    priorities = {'GET': get, 'POST': post}
+    
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            priority = priorities.get(request.method, PRIORITY_NORMAL)
+            
+            if not acquire_admission(priority):
+                logger.warning(f"Shed {PRIORITY_NAMES[priority]} {request.method} {request.path} under load")
+                response = jsonify({
+                    'status': 'error',
+                    'message': 'Server is busy. Please try again shortly.'
+                })
+                response.status_code = 503
+                response.headers['Retry-After'] = str(ADMISSION_RETRY_AFTER[priority])
+                return response
+            
+            try:
+                return f(*args, **kwargs)
+            finally:
+                release_admission()
+        return decorated_function
+    return decorator
+
+PROFILE_MODES = ('cprofile', 'sample')
+PROFILED_TARGETS = set()
+
+profiler_state = {
+    'session': None,
+    'last_session': None
+}
+
+profiler_lock = threading.Lock()
+cprofile_lock = threading.Lock()
+profiler_local = threading.local()
+
+def profiled(f):
+    # Fast path is a single dict lookup: nothing is wrapped, timed or sampled
+    # unless an admin has started a profiling session.
+    target = f.__name__
+    PROFILED_TARGETS.add(target)
+    
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        session = profiler_state['session']
+        if session is None or getattr(profiler_local, 'busy', False):
+            return f(*args, **kwargs)
+        
+        if session['mode'] == 'cprofile':
+            return run_with_cprofile(session, target, f, args, kwargs)
+        return run_with_sampler(session, target, f, args, kwargs)
+    return decorated_function
+
+def new_profile_session(mode, targets, max_requests, duration, sample_rate, interval):
+    now = time.time()
+    return {
+        'mode': mode,
+        'targets': set(targets),
+        'remaining': max_requests,
+        'deadline': now + duration if duration else None,
+        'sample_rate': sample_rate,
+        'interval': interval,
+        'started_at': now,
+        'finished_at': None,
+        'profiled': 0,
+        'skipped': 0,
+        'samples': 0,
+        'stats': None,
+        'stacks': {},
+        'active_threads': {}
+    }
+
+def finish_profile_session(session):
+    # Caller must hold profiler_lock.
+    if profiler_state['session'] is session:
+        profiler_state['session'] = None
+        profiler_state['last_session'] = session
+        session['finished_at'] = time.time()
+        logger.info(f"Profiling session finished: {session['profiled']} calls profiled")
+
+def expire_profile_session():
+    with profiler_lock:
+        session = profiler_state['session']
+        if session is not None and session['deadline'] and time.time() >= session['deadline']:
+            finish_profile_session(session)
+
+def claim_profile_slot(session, target):
+    with profiler_lock:
+        if profiler_state['session'] is not session:
+            return False
+        
+        if session['deadline'] and time.time() >= session['deadline']:
+            finish_profile_session(session)
+            return False
+        
+        if session['targets'] and target not in session['targets']:
+            return False
+        
+        if session['remaining'] is not None and session['remaining'] <= 0:
+            return False
+        
+        if random.random() >= session['sample_rate']:
+            session['skipped'] += 1
+            return False
+        
+        if session['remaining'] is not None:
+            session['remaining'] -= 1
+        session['profiled'] += 1
+        session['active_threads'][threading.get_ident()] = target
+        return True
+
+def count_profile_skip(session, target):
+    # Matching calls that ran unprofiled because another cProfile was active,
+    # so the summary shows how much of the traffic the pstats output covers.
+    with profiler_lock:
+        if profiler_state['session'] is not session:
+            return
+        
+        if session['targets'] and target not in session['targets']:
+            return
+        
+        if session['remaining'] is not None and session['remaining'] <= 0:
+            return
+        
+        session['skipped'] += 1
+
+def release_profile_slot(session, profile=None):
+    with profiler_lock:
+        session['active_threads'].pop(threading.get_ident(), None)
+        
+        if profile is not None:
+            if session['stats'] is None:
+                session['stats'] = pstats.Stats(profile)
+            else:
+                session['stats'].add(profile)
+        
+        if session['remaining'] == 0 and not session['active_threads']:
+            finish_profile_session(session)
+
+def run_with_cprofile(session, target, f, args, kwargs):
+    # Only one cProfile may be active at a time; concurrent calls simply
+    # run unprofiled, which is what makes this a sampled profile.
+    if not cprofile_lock.acquire(blocking=False):
+        count_profile_skip(session, target)
+        return f(*args, **kwargs)
+    
+    if not claim_profile_slot(session, target):
+        cprofile_lock.release()
+        return f(*args, **kwargs)
+    
+    profile = cProfile.Profile()
+    profiler_local.busy = True
+    try:
+        return profile.runcall(f, *args, **kwargs)
+    finally:
+        profiler_local.busy = False
+        cprofile_lock.release()
+        release_profile_slot(session, profile=profile)
+
+def run_with_sampler(session, target, f, args, kwargs):
+    if not claim_profile_slot(session, target):
+        return f(*args, **kwargs)
+    
+    profiler_local.busy = True
+    try:
+        return f(*args, **kwargs)
+    finally:
+        profiler_local.busy = False
+        release_profile_slot(session)
+
+def collapse_stack(frame, target):
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    frames.append(target)
+    return ';'.join(reversed(frames))
+
+def stack_sampler(session):
+    while True:
+        time.sleep(session['interval'])
+        frames = sys._current_frames()
+        
+        with profiler_lock:
+            if profiler_state['session'] is not session:
+                break
+            
+            if session['deadline'] and time.time() >= session['deadline']:
+                finish_profile_session(session)
+                break
+            
+            for thread_id, target in session['active_threads'].items():
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack = collapse_stack(frame, target)
+                session['stacks'][stack] = session['stacks'].get(stack, 0) + 1
+                session['samples'] += 1
+        
+        del frames
+
+def profile_session_summary(session):
+    if session is None:
+        return None
+    
+    return {
+        'mode': session['mode'],
+        'targets': sorted(session['targets']),
+        'remaining_requests': session['remaining'],
+        'deadline': datetime.fromtimestamp(session['deadline']).isoformat() if session['deadline'] else None,
+        'sample_rate': session['sample_rate'],
+        'interval_ms': round(session['interval'] * 1000, 3),
+        'started_at': datetime.fromtimestamp(session['started_at']).isoformat(),
+        'finished_at': datetime.fromtimestamp(session['finished_at']).isoformat() if session['finished_at'] else None,
+        'profiled': session['profiled'],
+        'skipped': session['skipped'],
+        'samples': session['samples'],
+        'in_flight': len(session['active_threads'])
+    }
+
 def ensure_directories():
     try:
         os.makedirs(DATA_DIR, exist_ok=True)
         os.makedirs(BACKUP_DIR, exist_ok=True)
-        logger.info(f"Directories created/verified: {DATA_DIR}, {BACKUP_DIR}")
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        logger.info(f"Directories created/verified: {DATA_DIR}, {BACKUP_DIR}, {SNAPSHOT_DIR}")
     except Exception as e:
         logger.error(f"Error creating directories: {e}")
         raise
@@ -152,9 +512,16 @@ def load_json_file(filepath, default=None):
             data = json.load(f)
         
         with data_lock:
+            if file_stat <= data_cache['last_modified'].get(cache_key, 0):
+                # A save landed while this read was in progress; keep the newer data.
+                return data_cache[cache_key]
+            
             data_cache[cache_key] = data
             data_cache['last_modified'][cache_key] = file_stat
             
+            if filepath == GUESSES_FILE:
+                rebuild_submission_index(data)
+            
         logger.info(f"Loaded {filepath} successfully")
         return data
         
@@ -192,6 +559,197 @@ def save_json_file(filepath, data):
                 pass
         return False
 
+SUBMISSION_EXAM_TYPES = ('midsem', 'compre')
+SUBMISSION_SORTS = ('timestamp', 'guess')
+
+submission_index = {
+    'rows': {},
+    'rows_by_user': {},
+    'usernames': [],
+    'timestamp': {},
+    'guess': {}
+}
+
+index_lock = threading.Lock()
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def submission_partitions(course, exam_type):
+    return [(None, None), (course, None), (None, exam_type), (course, exam_type)]
+
+def submission_sort_key(sort, row_id, row):
+    username, course, exam_type = row_id
+    return (row[sort], username, course, exam_type)
+
+def insert_submission_row(row_id, row):
+    _, course, exam_type = row_id
+    submission_index['rows'][row_id] = row
+    for sort in SUBMISSION_SORTS:
+        key = submission_sort_key(sort, row_id, row)
+        for partition in submission_partitions(course, exam_type):
+            bisect.insort(submission_index[sort].setdefault(partition, []), key)
+
+def remove_submission_row(row_id):
+    _, course, exam_type = row_id
+    row = submission_index['rows'].pop(row_id)
+    for sort in SUBMISSION_SORTS:
+        key = submission_sort_key(sort, row_id, row)
+        for partition in submission_partitions(course, exam_type):
+            keys = submission_index[sort][partition]
+            position = bisect.bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                del keys[position]
+
+def submission_rows_for_user(username, user_guesses):
+    rows = {}
+    if not isinstance(user_guesses, dict):
+        return rows
+    
+    for course, guess in user_guesses.items():
+        if not isinstance(guess, dict):
+            continue
+        
+        timestamp = guess.get('timestamp') or ''
+        for exam_type in SUBMISSION_EXAM_TYPES:
+            value = guess.get(exam_type)
+            if is_number(value) and isinstance(timestamp, str):
+                rows[(username, course, exam_type)] = {'guess': value, 'timestamp': timestamp}
+    return rows
+
+def reindex_submissions(changed_guesses):
+    # Clients post the whole guesses object, so most users in a write are
+    # unchanged; only rows whose guess or timestamp differ touch the sorted lists.
+    with index_lock:
+        rows_by_user = submission_index['rows_by_user']
+        indexed_rows = submission_index['rows']
+        
+        for username, user_guesses in changed_guesses.items():
+            rows = submission_rows_for_user(username, user_guesses)
+            old_row_ids = rows_by_user.get(username, [])
+            
+            if len(rows) == len(old_row_ids) and all(rows.get(row_id) == indexed_rows[row_id] for row_id in old_row_ids):
+                continue
+            
+            for row_id in old_row_ids:
+                if rows.get(row_id) != indexed_rows[row_id]:
+                    remove_submission_row(row_id)
+            
+            for row_id, row in rows.items():
+                if row_id not in indexed_rows:
+                    insert_submission_row(row_id, row)
+            
+            usernames = submission_index['usernames']
+            position = bisect.bisect_left(usernames, username)
+            listed = position < len(usernames) and usernames[position] == username
+            if rows:
+                rows_by_user[username] = list(rows)
+                if not listed:
+                    usernames.insert(position, username)
+            else:
+                rows_by_user.pop(username, None)
+                if listed:
+                    del usernames[position]
+
+def rebuild_submission_index(guesses):
+    with index_lock:
+        submission_index['rows'] = {}
+        submission_index['rows_by_user'] = {}
+        submission_index['timestamp'] = {}
+        submission_index['guess'] = {}
+        
+        for username, user_guesses in guesses.items():
+            rows = submission_rows_for_user(username, user_guesses)
+            if rows:
+                submission_index['rows'].update(rows)
+                submission_index['rows_by_user'][username] = list(rows)
+        
+        submission_index['usernames'] = sorted(submission_index['rows_by_user'])
+        
+        for sort in SUBMISSION_SORTS:
+            partitions = submission_index[sort]
+            for row_id, row in submission_index['rows'].items():
+                key = submission_sort_key(sort, row_id, row)
+                for partition in submission_partitions(row_id[1], row_id[2]):
+                    partitions.setdefault(partition, []).append(key)
+            for keys in partitions.values():
+                keys.sort()
+    
+    logger.info(f"Submission index rebuilt: {len(submission_index['rows'])} predictions")
+
+def encode_submission_cursor(key):
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode('utf-8')).decode('ascii')
+
+def decode_submission_cursor(cursor, sort):
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError):
+        return None
+    
+    if not isinstance(key, list) or len(key) != 4 or not all(isinstance(part, str) for part in key[1:]):
+        return None
+    
+    value_type = str if sort == 'timestamp' else (int, float)
+    if not isinstance(key[0], value_type) or isinstance(key[0], bool):
+        return None
+    return tuple(key)
+
+def query_submissions(course=None, exam_type=None, username_prefix='', submitted_after='',
+                      sort='timestamp', descending=True, cursor=None, limit=50):
+    with index_lock:
+        if username_prefix:
+            # Prefix filters go through the sorted username index, so the work
+            # is bounded by the matching users' rows rather than every row.
+            usernames = submission_index['usernames']
+            keys = []
+            position = bisect.bisect_left(usernames, username_prefix)
+            while position < len(usernames) and usernames[position].startswith(username_prefix):
+                for row_id in submission_index['rows_by_user'][usernames[position]]:
+                    if (course is None or row_id[1] == course) and (exam_type is None or row_id[2] == exam_type):
+                        keys.append(submission_sort_key(sort, row_id, submission_index['rows'][row_id]))
+                position += 1
+            keys.sort()
+        else:
+            keys = submission_index[sort].get((course, exam_type), [])
+        
+        if descending:
+            end = bisect.bisect_left(keys, cursor) if cursor else len(keys)
+            candidates = (keys[i] for i in range(end - 1, -1, -1))
+        else:
+            start = bisect.bisect_right(keys, cursor) if cursor else 0
+            if sort == 'timestamp' and submitted_after:
+                start = max(start, bisect.bisect_left(keys, (submitted_after,)))
+            candidates = (keys[i] for i in range(start, len(keys)))
+        
+        page = []
+        has_more = False
+        for key in candidates:
+            row_id = key[1:]
+            row = submission_index['rows'][row_id]
+            if submitted_after and row['timestamp'] < submitted_after:
+                # Newest-first timestamp scans can stop at the first older row.
+                if sort == 'timestamp' and descending:
+                    break
+                continue
+            
+            if len(page) == limit:
+                has_more = True
+                break
+            
+            page.append((key, row_id, row))
+    
+    submissions = [{
+        'username': username,
+        'course': course_id,
+        'course_name': COURSE_NAMES.get(course_id, course_id),
+        'exam_type': exam,
+        'guess': row['guess'],
+        'timestamp': row['timestamp']
+    } for _, (username, course_id, exam), row in page]
+    
+    next_cursor = encode_submission_cursor(page[-1][0]) if has_more else None
+    return submissions, next_cursor
+
 def create_backup():
     try:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -240,75 +798,81 @@ def cleanup_old_backups(keep_count=10):
     except Exception as e:
         logger.error(f"Error cleaning up backups: {e}")
 
+def write_guesses_csv(filepath, guesses):
+    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        fieldnames = ['Username', 'Course', 'Course Name', 'Midsem Guess', 'Compre Guess', 'Timestamp']
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        
+        for username, user_guesses in guesses.items():
+            for course, guess_data in user_guesses.items():
+                writer.writerow({
+                    'Username': username,
+                    'Course': course,
+                    'Course Name': COURSE_NAMES.get(course, course),
+                    'Midsem Guess': guess_data.get('midsem', ''),
+                    'Compre Guess': guess_data.get('compre', ''),
+                    'Timestamp': guess_data.get('timestamp', '')
+                })
+
+def write_results_csv(filepath, results):
+    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        fieldnames = ['Course', 'Course Name', 'Exam Type', 'Average']
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        
+        for course, course_results in results.items():
+            for exam_type, average in course_results.items():
+                writer.writerow({
+                    'Course': course,
+                    'Course Name': COURSE_NAMES.get(course, course),
+                    'Exam Type': exam_type,
+                    'Average': average
+                })
+
+def write_analysis_csv(filepath, guesses, results):
+    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        fieldnames = ['Course', 'Course Name', 'Exam Type', 'Username', 'User Guess', 'Actual Average', 'Difference', 'Is Winner']
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        
+        for course, course_results in results.items():
+            for exam_type, actual_avg in course_results.items():
+                for username, user_guesses in guesses.items():
+                    if course in user_guesses and user_guesses[course].get(exam_type) is not None:
+                        user_guess = user_guesses[course][exam_type]
+                        difference = abs(actual_avg - user_guess)
+                        is_winner = difference <= 1
+                        
+                        writer.writerow({
+                            'Course': course,
+                            'Course Name': COURSE_NAMES.get(course, course),
+                            'Exam Type': exam_type,
+                            'Username': username,
+                            'User Guess': user_guess,
+                            'Actual Average': actual_avg,
+                            'Difference': round(difference, 2),
+                            'Is Winner': 'Yes' if is_winner else 'No'
+                        })
+
+@profiled
 def export_to_csv():
     try:
-        users = load_json_file(USERS_FILE)
         guesses = load_json_file(GUESSES_FILE)
         results = load_json_file(RESULTS_FILE)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         guesses_csv_file = os.path.join(DATA_DIR, f'guesses_export_{timestamp}.csv')
-        with open(guesses_csv_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Username', 'Course', 'Course Name', 'Midsem Guess', 'Compre Guess', 'Timestamp']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for username, user_guesses in guesses.items():
-                for course, guess_data in user_guesses.items():
-                    writer.writerow({
-                        'Username': username,
-                        'Course': course,
-                        'Course Name': COURSE_NAMES.get(course, course),
-                        'Midsem Guess': guess_data.get('midsem', ''),
-                        'Compre Guess': guess_data.get('compre', ''),
-                        'Timestamp': guess_data.get('timestamp', '')
-                    })
-        
+        write_guesses_csv(guesses_csv_file, guesses)
         logger.info(f"Guesses exported to: {guesses_csv_file}")
         
         results_csv_file = os.path.join(DATA_DIR, f'results_export_{timestamp}.csv')
-        with open(results_csv_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Course', 'Course Name', 'Exam Type', 'Average']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for course, course_results in results.items():
-                for exam_type, average in course_results.items():
-                    writer.writerow({
-                        'Course': course,
-                        'Course Name': COURSE_NAMES.get(course, course),
-                        'Exam Type': exam_type,
-                        'Average': average
-                    })
-        
+        write_results_csv(results_csv_file, results)
         logger.info(f"Results exported to: {results_csv_file}")
         
         analysis_csv_file = os.path.join(DATA_DIR, f'detailed_analysis_{timestamp}.csv')
-        with open(analysis_csv_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Course', 'Course Name', 'Exam Type', 'Username', 'User Guess', 'Actual Average', 'Difference', 'Is Winner']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for course, course_results in results.items():
-                for exam_type, actual_avg in course_results.items():
-                    for username, user_guesses in guesses.items():
-                        if course in user_guesses and user_guesses[course].get(exam_type) is not None:
-                            user_guess = user_guesses[course][exam_type]
-                            difference = abs(actual_avg - user_guess)
-                            is_winner = difference <= 1
-                            
-                            writer.writerow({
-                                'Course': course,
-                                'Course Name': COURSE_NAMES.get(course, course),
-                                'Exam Type': exam_type,
-                                'Username': username,
-                                'User Guess': user_guess,
-                                'Actual Average': actual_avg,
-                                'Difference': round(difference, 2),
-                                'Is Winner': 'Yes' if is_winner else 'No'
-                            })
-        
+        write_analysis_csv(analysis_csv_file, guesses, results)
         logger.info(f"Detailed analysis exported to: {analysis_csv_file}")
         return True
             
@@ -316,6 +880,241 @@ def export_to_csv():
         logger.error(f"Error exporting to CSV: {e}")
         return False
 
+SNAPSHOT_CHUNK_SIZE = 64 * 1024
+
+SNAPSHOT_MIMETYPES = {
+    '.json': 'application/json',
+    '.csv': 'text/csv'
+}
+
+snapshot_state = {
+    'pointer': None,
+    'snapshot': None
+}
+
+snapshot_map_lock = threading.Lock()
+
+@contextmanager
+def freeze_lock():
+    # Held by writers across their frozen check and save, and by freeze/unfreeze,
+    # so no write can land after a snapshot has been encoded. flock is taken on a
+    # fresh open file each time, which excludes other threads as well as other
+    # worker processes.
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    with open(FREEZE_LOCK_FILE, 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+def encode_json_body(data):
+    # Byte-for-byte what jsonify returns, so frozen and live responses match.
+    return (json.dumps(data, sort_keys=True, separators=(',', ':')) + '\n').encode('utf-8')
+
+def build_leaderboard(guesses, course, exam_type, actual_avg):
+    entries = []
+    for username, user_guesses in guesses.items():
+        if course in user_guesses and user_guesses[course].get(exam_type) is not None:
+            user_guess = user_guesses[course][exam_type]
+            difference = abs(actual_avg - user_guess)
+            entries.append({
+                'username': username,
+                'guess': user_guess,
+                'difference': round(difference, 2),
+                'is_winner': difference <= 1
+            })
+    
+    entries.sort(key=lambda entry: (entry['difference'], entry['username']))
+    for rank, entry in enumerate(entries, start=1):
+        entry['rank'] = rank
+    
+    return {
+        'course': course,
+        'course_name': COURSE_NAMES.get(course, course),
+        'exam_type': exam_type,
+        'actual_average': actual_avg,
+        'participants': len(entries),
+        'winners': sum(1 for entry in entries if entry['is_winner']),
+        'leaderboard': entries
+    }
+
+def snapshot_inputs(guesses, results):
+    # Results and guesses arrive from unauthenticated POSTs; skip malformed
+    # entries the way get_stats does so one bad key cannot break a freeze.
+    valid_results = {}
+    for course, course_results in results.items():
+        if isinstance(course_results, dict):
+            averages = {exam_type: average for exam_type, average in course_results.items() if is_number(average)}
+            if averages:
+                valid_results[course] = averages
+    
+    valid_guesses = {}
+    for username, user_guesses in guesses.items():
+        if not isinstance(user_guesses, dict):
+            continue
+        valid_guesses[username] = {
+            course: {
+                'midsem': guess.get('midsem') if is_number(guess.get('midsem')) else None,
+                'compre': guess.get('compre') if is_number(guess.get('compre')) else None,
+                'timestamp': guess.get('timestamp', '')
+            }
+            for course, guess in user_guesses.items() if isinstance(guess, dict)
+        }
+    
+    return valid_guesses, valid_results
+
+def create_snapshot():
+    guesses = load_json_file(GUESSES_FILE)
+    results = load_json_file(RESULTS_FILE)
+    valid_guesses, valid_results = snapshot_inputs(guesses, results)
+    
+    bodies = {
+        'guesses.json': encode_json_body(guesses),
+        'results.json': encode_json_body(results)
+    }
+    
+    # File names never include result keys, which are client-controlled;
+    # the manifest maps each leaderboard file back to its course and exam.
+    leaderboards = []
+    for course, course_results in valid_results.items():
+        for exam_type, actual_avg in course_results.items():
+            name = f'leaderboard-{len(leaderboards)}.json'
+            bodies[name] = encode_json_body(build_leaderboard(valid_guesses, course, exam_type, actual_avg))
+            leaderboards.append({
+                'course': course,
+                'course_name': COURSE_NAMES.get(course, course),
+                'exam_type': exam_type,
+                'file': name
+            })
+    
+    snapshot_id = hashlib.sha256(bodies['guesses.json'] + bodies['results.json']).hexdigest()[:16]
+    snapshot_path = os.path.join(SNAPSHOT_DIR, snapshot_id)
+    
+    if not os.path.exists(snapshot_path):
+        temp_path = snapshot_path + '.tmp'
+        shutil.rmtree(temp_path, ignore_errors=True)
+        os.makedirs(temp_path)
+        
+        try:
+            for name, body in bodies.items():
+                with open(os.path.join(temp_path, name), 'wb') as f:
+                    f.write(body)
+            
+            write_guesses_csv(os.path.join(temp_path, 'guesses.csv'), valid_guesses)
+            write_results_csv(os.path.join(temp_path, 'results.csv'), valid_results)
+            write_analysis_csv(os.path.join(temp_path, 'detailed_analysis.csv'), valid_guesses, valid_results)
+            
+            files = {}
+            for name in sorted(os.listdir(temp_path)):
+                with open(os.path.join(temp_path, name), 'rb') as f:
+                    content = f.read()
+                files[name] = {
+                    'etag': hashlib.sha256(content).hexdigest(),
+                    'size': len(content),
+                    'url': f'/api/snapshot/{snapshot_id}/{name}'
+                }
+            
+            manifest = {
+                'snapshot_id': snapshot_id,
+                'created_at': datetime.now().isoformat(),
+                'files': files,
+                'leaderboards': leaderboards
+            }
+            with open(os.path.join(temp_path, 'manifest.json'), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            
+            os.replace(temp_path, snapshot_path)
+        except Exception:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            raise
+    
+    temp_pointer = SNAPSHOT_POINTER_FILE + '.tmp'
+    with open(temp_pointer, 'w', encoding='utf-8') as f:
+        f.write(snapshot_id)
+    os.replace(temp_pointer, SNAPSHOT_POINTER_FILE)
+    
+    # Workers still mapping an older snapshot keep their pages after unlink.
+    for name in os.listdir(SNAPSHOT_DIR):
+        path = os.path.join(SNAPSHOT_DIR, name)
+        if name != snapshot_id and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+    
+    logger.info(f"Competition frozen into snapshot {snapshot_id}")
+    return snapshot_id
+
+def remove_snapshot_pointer():
+    if os.path.exists(SNAPSHOT_POINTER_FILE):
+        os.remove(SNAPSHOT_POINTER_FILE)
+        logger.info("Competition unfrozen")
+
+def map_snapshot(snapshot_id):
+    snapshot_path = os.path.join(SNAPSHOT_DIR, snapshot_id)
+    with open(os.path.join(snapshot_path, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    files = {}
+    for name, info in manifest['files'].items():
+        with open(os.path.join(snapshot_path, name), 'rb') as f:
+            files[name] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    return {'manifest': manifest, 'files': files}
+
+def current_snapshot():
+    # Every worker process maps the same files, so the page cache is shared;
+    # the pointer file's stat tells each worker when a freeze has changed.
+    try:
+        pointer_stat = os.stat(SNAPSHOT_POINTER_FILE)
+        pointer = (pointer_stat.st_mtime_ns, pointer_stat.st_ino)
+    except OSError:
+        pointer = None
+    
+    with snapshot_map_lock:
+        if pointer == snapshot_state['pointer']:
+            return snapshot_state['snapshot']
+        
+        snapshot = None
+        if pointer is not None:
+            try:
+                with open(SNAPSHOT_POINTER_FILE, 'r', encoding='utf-8') as f:
+                    snapshot = map_snapshot(f.read().strip())
+            except Exception as e:
+                logger.error(f"Error mapping snapshot: {e}")
+                return None
+        
+        snapshot_state['pointer'] = pointer
+        snapshot_state['snapshot'] = snapshot
+        return snapshot
+
+def iter_mapped_file(mapped):
+    # WSGI servers need bytes, so stream bounded slices rather than copying
+    # the whole mapping per request.
+    for offset in range(0, len(mapped), SNAPSHOT_CHUNK_SIZE):
+        yield mapped[offset:offset + SNAPSHOT_CHUNK_SIZE]
+
+def snapshot_response(snapshot, name, cache_control):
+    info = snapshot['manifest']['files'][name]
+    
+    if request.if_none_match.contains_weak(info['etag']):
+        response = app.response_class(status=304)
+    else:
+        mapped = snapshot['files'][name]
+        mimetype = SNAPSHOT_MIMETYPES.get(os.path.splitext(name)[1], 'application/octet-stream')
+        response = app.response_class(iter_mapped_file(mapped), mimetype=mimetype, direct_passthrough=True)
+        response.content_length = len(mapped)
+        if mimetype == 'text/csv':
+            response.headers['Content-Disposition'] = f'attachment; filename="{name}"'
+    
+    response.set_etag(info['etag'])
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+def frozen_response():
+    return jsonify({
+        'status': 'error',
+        'message': 'Competition is frozen. Unfreeze it before making changes.'
+    }), 409
+
 @app.before_request
 def before_request():
     if request.method == 'OPTIONS':
@@ -332,7 +1131,8 @@ def after_request(response):
     response.headers.add('Access-Control-Allow-Methods', 'GET,POST,OPTIONS')
     response.headers.add('X-Content-Type-Options', 'nosniff')
     response.headers.add('X-Frame-Options', 'DENY')
-    response.headers.add('Cache-Control', 'no-cache, no-store, must-revalidate')
+    if 'Cache-Control' not in response.headers:
+        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
     return response
 
 @app.route('/', methods=['GET'])
@@ -347,12 +1147,20 @@ def root():
             'GET/POST /api/users',
             'GET/POST /api/guesses',
             'GET/POST /api/results',
+            'GET /api/submissions',
             'GET /health',
             'GET /api/stats',
+            'GET /api/admission',
             'POST /api/backup',
             'POST /api/export-csv',
             'POST /api/clear-all',
-            'POST /api/restart-competition'
+            'POST /api/restart-competition',
+            'GET /api/snapshot',
+            'GET /api/snapshot/<snapshot_id>/<name>',
+            'POST /api/admin/freeze',
+            'POST /api/admin/unfreeze',
+            'GET/POST /api/admin/profile',
+            'POST /api/admin/profile/stop'
         ]
     })
 
@@ -390,6 +1198,7 @@ def health_check():
             'files_exist': files_exist,
             'disk_usage': disk_usage,
             'cache_status': cache_status,
+            'admission': admission_status(),
             'version': '2.0'
         })
     except Exception as e:
@@ -402,7 +1211,9 @@ def health_check():
 
 @app.route('/api/users', methods=['GET', 'POST'])
 @rate_limit(max_requests=50, per_seconds=60)
+@admission_control(get=PRIORITY_NORMAL, post=PRIORITY_NORMAL)
 @handle_errors
+@profiled
 def handle_users():
     if request.method == 'GET':
         users = load_json_file(USERS_FILE)
@@ -428,9 +1239,15 @@ def handle_users():
 
 @app.route('/api/guesses', methods=['GET', 'POST'])
 @rate_limit(max_requests=100, per_seconds=60)
+@admission_control(get=PRIORITY_NORMAL, post=PRIORITY_CRITICAL)
 @handle_errors
+@profiled
 def handle_guesses():
     if request.method == 'GET':
+        snapshot = current_snapshot()
+        if snapshot is not None:
+            return snapshot_response(snapshot, 'guesses.json', 'no-cache')
+        
         guesses = load_json_file(GUESSES_FILE)
         logger.info(f"GET /api/guesses - returning guesses for {len(guesses)} users")
         return jsonify(guesses)
@@ -443,21 +1260,93 @@ def handle_guesses():
         if not isinstance(data, dict):
             return jsonify({'status': 'error', 'message': 'Data must be a JSON object'}), 400
             
-        guesses = load_json_file(GUESSES_FILE)
-        guesses.update(data)
+        with freeze_lock():
+            if current_snapshot() is not None:
+                return frozen_response()
+            
+            guesses = load_json_file(GUESSES_FILE)
+            guesses.update(data)
+            saved = save_json_file(GUESSES_FILE, guesses)
+            
+            # Indexed inside the same critical section so the index sees
+            # writes in the order they reached disk.
+            if saved:
+                reindex_submissions({username: guesses.get(username) for username in data})
         
-        if save_json_file(GUESSES_FILE, guesses):
+        if saved:
             threading.Thread(target=export_to_csv, daemon=True).start()
             logger.info(f"POST /api/guesses - updated guesses successfully")
             return jsonify({'status': 'success', 'message': 'Guesses updated'})
         else:
             return jsonify({'status': 'error', 'message': 'Failed to save guesses'}), 500
 
+@app.route('/api/submissions', methods=['GET'])
+@rate_limit(max_requests=120, per_seconds=60)
+@admission_control(get=PRIORITY_NORMAL)
+@handle_errors
+@profiled
+def get_submissions():
+    # Refreshes the index through the mtime check if another process wrote guesses.
+    load_json_file(GUESSES_FILE)
+    
+    course = request.args.get('course') or None
+    exam_type = request.args.get('exam_type') or None
+    username_prefix = request.args.get('username_prefix', '')
+    submitted_after = request.args.get('submitted_after', '')
+    sort = request.args.get('sort', 'timestamp')
+    order = request.args.get('order', 'desc')
+    limit = request.args.get('limit', type=int) if 'limit' in request.args else 50
+    
+    if course is not None and course not in COURSE_NAMES:
+        return jsonify({'status': 'error', 'message': f'Unknown course: {course}'}), 400
+    
+    if exam_type is not None and exam_type not in SUBMISSION_EXAM_TYPES:
+        return jsonify({'status': 'error', 'message': 'exam_type must be midsem or compre'}), 400
+    
+    if sort not in SUBMISSION_SORTS:
+        return jsonify({'status': 'error', 'message': 'sort must be timestamp or guess'}), 400
+    
+    if order not in ('asc', 'desc'):
+        return jsonify({'status': 'error', 'message': 'order must be asc or desc'}), 400
+    
+    if limit is None or not 1 <= limit <= 500:
+        return jsonify({'status': 'error', 'message': 'limit must be between 1 and 500'}), 400
+    
+    cursor = None
+    if request.args.get('cursor'):
+        cursor = decode_submission_cursor(request.args['cursor'], sort)
+        if cursor is None:
+            return jsonify({'status': 'error', 'message': 'Invalid cursor'}), 400
+    
+    submissions, next_cursor = query_submissions(
+        course=course,
+        exam_type=exam_type,
+        username_prefix=username_prefix,
+        submitted_after=submitted_after,
+        sort=sort,
+        descending=order == 'desc',
+        cursor=cursor,
+        limit=limit
+    )
+    
+    logger.info(f"GET /api/submissions - returning {len(submissions)} submissions")
+    return jsonify({
+        'status': 'success',
+        'submissions': submissions,
+        'next_cursor': next_cursor
+    })
+
 @app.route('/api/results', methods=['GET', 'POST'])
 @rate_limit(max_requests=50, per_seconds=60)
+@admission_control(get=PRIORITY_NORMAL, post=PRIORITY_CRITICAL)
 @handle_errors
+@profiled
 def handle_results():
     if request.method == 'GET':
+        snapshot = current_snapshot()
+        if snapshot is not None:
+            return snapshot_response(snapshot, 'results.json', 'no-cache')
+        
         results = load_json_file(RESULTS_FILE)
         logger.info(f"GET /api/results - returning results for {len(results)} courses")
         return jsonify(results)
@@ -470,10 +1359,15 @@ def handle_results():
         if not isinstance(data, dict):
             return jsonify({'status': 'error', 'message': 'Data must be a JSON object'}), 400
             
-        results = load_json_file(RESULTS_FILE)
-        results.update(data)
+        with freeze_lock():
+            if current_snapshot() is not None:
+                return frozen_response()
+            
+            results = load_json_file(RESULTS_FILE)
+            results.update(data)
+            saved = save_json_file(RESULTS_FILE, results)
         
-        if save_json_file(RESULTS_FILE, results):
+        if saved:
             threading.Thread(target=export_to_csv, daemon=True).start()
             logger.info(f"POST /api/results - updated results successfully")
             return jsonify({'status': 'success', 'message': 'Results updated'})
@@ -516,15 +1410,19 @@ def clear_all_data():
     try:
         create_backup()
         
-        save_json_file(USERS_FILE, {})
-        save_json_file(GUESSES_FILE, {})
-        save_json_file(RESULTS_FILE, {})
+        with freeze_lock():
+            remove_snapshot_pointer()
+            save_json_file(USERS_FILE, {})
+            save_json_file(GUESSES_FILE, {})
+            save_json_file(RESULTS_FILE, {})
         
         with data_lock:
             data_cache['users'] = {}
             data_cache['guesses'] = {}
             data_cache['actual_results'] = {}
         
+        rebuild_submission_index({})
+        
         logger.info("All data cleared successfully")
         return jsonify({'status': 'success', 'message': 'All data cleared'})
     except Exception as e:
@@ -538,22 +1436,79 @@ def restart_competition():
     try:
         create_backup()
         
-        save_json_file(GUESSES_FILE, {})
-        save_json_file(RESULTS_FILE, {})
+        with freeze_lock():
+            remove_snapshot_pointer()
+            save_json_file(GUESSES_FILE, {})
+            save_json_file(RESULTS_FILE, {})
         
         with data_lock:
             data_cache['guesses'] = {}
             data_cache['actual_results'] = {}
         
+        rebuild_submission_index({})
+        
         logger.info("Competition restarted successfully")
         return jsonify({'status': 'success', 'message': 'Competition restarted'})
     except Exception as e:
         logger.error(f"Error restarting competition: {e}")
         return jsonify({'status': 'error', 'message': f'Failed to restart competition: {str(e)}'}), 500
 
+@app.route('/api/admin/freeze', methods=['POST'])
+@rate_limit(max_requests=5, per_seconds=300)
+@handle_errors
+@require_admin
+def freeze_competition():
+    with freeze_lock():
+        snapshot_id = create_snapshot()
+    
+    snapshot = current_snapshot()
+    if snapshot is None:
+        return jsonify({'status': 'error', 'message': 'Failed to load frozen snapshot'}), 500
+    
+    return jsonify({
+        'status': 'success',
+        'message': 'Competition frozen',
+        'snapshot_id': snapshot_id,
+        'manifest': snapshot['manifest']
+    })
+
+@app.route('/api/admin/unfreeze', methods=['POST'])
+@rate_limit(max_requests=5, per_seconds=300)
+@handle_errors
+@require_admin
+def unfreeze_competition():
+    with freeze_lock():
+        remove_snapshot_pointer()
+    
+    return jsonify({'status': 'success', 'message': 'Competition unfrozen'})
+
+@app.route('/api/snapshot', methods=['GET'])
+@rate_limit(max_requests=300, per_seconds=60)
+@handle_errors
+def get_snapshot_manifest():
+    snapshot = current_snapshot()
+    if snapshot is None:
+        return jsonify({'status': 'error', 'message': 'Competition is not frozen'}), 404
+    
+    return jsonify(snapshot['manifest'])
+
+@app.route('/api/snapshot/<snapshot_id>/<name>', methods=['GET'])
+@rate_limit(max_requests=300, per_seconds=60)
+@handle_errors
+def get_snapshot_file(snapshot_id, name):
+    snapshot = current_snapshot()
+    if (snapshot is None or snapshot['manifest']['snapshot_id'] != snapshot_id or
+            name not in snapshot['manifest']['files']):
+        return jsonify({'status': 'error', 'message': 'Snapshot file not found'}), 404
+    
+    # Snapshot URLs are content-addressed, so they can be cached indefinitely.
+    return snapshot_response(snapshot, name, 'public, max-age=31536000, immutable')
+
 @app.route('/api/stats', methods=['GET'])
 @rate_limit(max_requests=60, per_seconds=60)
+@admission_control(get=PRIORITY_LOW)
 @handle_errors
+@profiled
 def get_stats():
     try:
         users = load_json_file(USERS_FILE)
@@ -592,6 +1547,7 @@ def get_stats():
 
 @app.route('/api/system-info', methods=['GET'])
 @rate_limit(max_requests=10, per_seconds=60)
+@admission_control(get=PRIORITY_LOW)
 @handle_errors
 def get_system_info():
     try:
@@ -636,6 +1592,125 @@ def get_system_info():
         logger.error(f"Error getting system info: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+@app.route('/api/admission', methods=['GET'])
+@rate_limit(max_requests=60, per_seconds=60)
+@handle_errors
+def get_admission_status():
+    return jsonify(admission_status())
+
+@app.route('/api/admin/profile', methods=['GET', 'POST'])
+@rate_limit(max_requests=30, per_seconds=60)
+@handle_errors
+@require_admin
+def admin_profile():
+    if request.method == 'GET':
+        expire_profile_session()
+        output_format = request.args.get('format', 'json')
+        
+        with profiler_lock:
+            session = profiler_state['session'] or profiler_state['last_session']
+            
+            if output_format == 'json':
+                return jsonify({
+                    'status': 'success',
+                    'active': profile_session_summary(profiler_state['session']),
+                    'last': profile_session_summary(profiler_state['last_session']),
+                    'targets': sorted(PROFILED_TARGETS)
+                })
+            
+            if session is None:
+                return jsonify({'status': 'error', 'message': 'No profiling session recorded'}), 404
+            
+            if output_format == 'pstats':
+                if session['stats'] is None:
+                    return jsonify({'status': 'error', 'message': 'No cProfile data collected'}), 404
+                
+                sort_key = request.args.get('sort', 'cumulative')
+                limit = request.args.get('limit', 50, type=int)
+                stream = io.StringIO()
+                session['stats'].stream = stream
+                try:
+                    session['stats'].sort_stats(sort_key).print_stats(limit)
+                except KeyError:
+                    return jsonify({'status': 'error', 'message': f'Invalid sort key: {sort_key}'}), 400
+                body = stream.getvalue()
+            
+            elif output_format == 'collapsed':
+                if not session['stacks']:
+                    return jsonify({'status': 'error', 'message': 'No stack samples collected'}), 404
+                
+                body = ''.join(f"{stack} {count}\n" for stack, count in sorted(session['stacks'].items()))
+            
+            else:
+                return jsonify({'status': 'error', 'message': 'Format must be json, pstats or collapsed'}), 400
+        
+        return app.response_class(body, mimetype='text/plain')
+    
+    elif request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        if not isinstance(data, dict):
+            return jsonify({'status': 'error', 'message': 'Data must be a JSON object'}), 400
+        
+        mode = data.get('mode', 'cprofile')
+        if mode not in PROFILE_MODES:
+            return jsonify({'status': 'error', 'message': 'Mode must be cprofile or sample'}), 400
+        
+        targets = data.get('routes') or []
+        if not isinstance(targets, list) or any(target not in PROFILED_TARGETS for target in targets):
+            return jsonify({
+                'status': 'error',
+                'message': f'Routes must be a list drawn from: {", ".join(sorted(PROFILED_TARGETS))}'
+            }), 400
+        
+        try:
+            max_requests = int(data['requests']) if data.get('requests') is not None else None
+            duration = float(data['seconds']) if data.get('seconds') is not None else None
+            sample_rate = float(data.get('sample_rate', 1.0))
+            interval = float(data.get('interval_ms', 10)) / 1000
+        except (TypeError, ValueError):
+            return jsonify({'status': 'error', 'message': 'requests, seconds, sample_rate and interval_ms must be numbers'}), 400
+        
+        if max_requests is None and duration is None:
+            duration = 60
+        
+        if (max_requests is not None and not 1 <= max_requests <= 10000) or \
+           (duration is not None and not 0 < duration <= 600) or \
+           not 0 < sample_rate <= 1 or not 0.001 <= interval <= 1:
+            return jsonify({'status': 'error', 'message': 'Profiling parameters out of range'}), 400
+        
+        with profiler_lock:
+            if profiler_state['session'] is not None:
+                return jsonify({'status': 'error', 'message': 'A profiling session is already running'}), 409
+            
+            session = new_profile_session(mode, targets, max_requests, duration, sample_rate, interval)
+            profiler_state['session'] = session
+        
+        if mode == 'sample':
+            threading.Thread(target=stack_sampler, args=(session,), daemon=True).start()
+        
+        logger.info(f"Profiling session started: mode={mode}, routes={targets or 'all'}, "
+                    f"requests={max_requests}, seconds={duration}")
+        return jsonify({
+            'status': 'success',
+            'message': 'Profiling started',
+            'session': profile_session_summary(session)
+        })
+
+@app.route('/api/admin/profile/stop', methods=['POST'])
+@rate_limit(max_requests=30, per_seconds=60)
+@handle_errors
+@require_admin
+def stop_admin_profile():
+    with profiler_lock:
+        session = profiler_state['session']
+        if session is None:
+            return jsonify({'status': 'error', 'message': 'No profiling session is running'}), 404
+        
+        finish_profile_session(session)
+        summary = profile_session_summary(session)
+    
+    return jsonify({'status': 'success', 'message': 'Profiling stopped', 'session': summary})
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({'status': 'error', 'message': 'Endpoint not found'}), 404
@@ -702,20 +1777,32 @@ if __name__ == '__main__':
         logger.info("Server will run on http://0.0.0.0:5000")
         logger.info("Enhanced features:")
         logger.info("  - Request rate limiting")
+        logger.info(f"  - Priority admission control (max {MAX_CONCURRENT_REQUESTS} concurrent)")
         logger.info("  - Data caching")
+        logger.info("  - Indexed submission queries")
         logger.info("  - Atomic file writes")
         logger.info("  - Automatic backups")
         logger.info("  - Background CSV exports")
         logger.info("  - Enhanced error handling")
+        logger.info("  - On-demand admin profiling")
+        logger.info("  - Frozen memory-mapped snapshots")
         logger.info("API endpoints:")
         logger.info("  GET/POST /api/users")
         logger.info("  GET/POST /api/guesses") 
         logger.info("  GET/POST /api/results")
+        logger.info("  GET /api/submissions")
         logger.info("  POST /api/backup")
         logger.info("  POST /api/export-csv")
         logger.info("  GET /api/stats")
         logger.info("  GET /api/system-info")
+        logger.info("  GET /api/admission")
         logger.info("  GET /health")
+        logger.info("  GET /api/snapshot")
+        logger.info("  GET /api/snapshot/<snapshot_id>/<name>")
+        logger.info("  POST /api/admin/freeze")
+        logger.info("  POST /api/admin/unfreeze")
+        logger.info("  GET/POST /api/admin/profile")
+        logger.info("  POST /api/admin/profile/stop")
         
         create_backup()
         